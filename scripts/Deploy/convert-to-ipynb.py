@@ -2,84 +2,81 @@
 """Convert Python notebook format to .ipynb format for Fabric."""
 
 import json
-import re
 import sys
 
-def convert_py_to_ipynb(py_path: str, ipynb_path: str):
-    """Convert a Python file with cell markers to ipynb format."""
-
-    with open(py_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Split by cell markers
-    cell_pattern = r'# %%( \[markdown\])?'
-
-    cells = []
-    current_pos = 0
-
-    # Find all cell markers
-    matches = list(re.finditer(cell_pattern, content))
-
-    # If no markers, treat entire file as one code cell
-    if not matches:
+try:
+    import orjson
+except ImportError:  # stdlib json fallback
+    orjson = None
+
+# Cell markers (Jupytext "percent" format)
+CELL_MARKER = '# %%'
+MARKDOWN_TAG = ' [markdown]'
+
+def _trim_lines(source: list) -> list:
+    """Strip surrounding whitespace from a list of lines without re-joining them."""
+    start, end = 0, len(source)
+    while start < end and not source[start].strip():
+        start += 1
+    while end > start and not source[end - 1].strip():
+        end -= 1
+    if start == end:
+        return []
+
+    lines = source[start:end]
+    lines[0] = lines[0].lstrip()
+    lines[-1] = lines[-1].rstrip()
+    return lines
+
+
+def _flush_cell(cells: list, cell_type, source: list):
+    """Append the collected lines as a notebook cell (skips empty code cells)."""
+    lines = _trim_lines(source)
+    # nbformat accepts a single string per cell: fewer JSON tokens than a list of lines
+    source_text = ''.join(lines)
+
+    if cell_type == 'markdown':
+        cells.append({
+            "cell_type": "markdown",
+            "metadata": {},
+            "source": source_text
+        })
+    elif source_text:
         cells.append({
             "cell_type": "code",
             "execution_count": None,
             "metadata": {},
             "outputs": [],
-            "source": content.splitlines(keepends=True)
+            "source": source_text
         })
-    else:
-        # Process header before first marker
-        if matches[0].start() > 0:
-            header = content[:matches[0].start()].strip()
-            if header:
-                cells.append({
-                    "cell_type": "code",
-                    "execution_count": None,
-                    "metadata": {},
-                    "outputs": [],
-                    "source": header.splitlines(keepends=True)
-                })
-
-        # Process each cell
-        for i, match in enumerate(matches):
-            is_markdown = match.group(1) is not None
-
-            # Find end of cell
-            end_pos = matches[i+1].start() if i+1 < len(matches) else len(content)
-
-            # Extract cell content (skip the marker line)
-            marker_end = content.find('\n', match.end())
-            cell_content = content[marker_end+1:end_pos].strip()
-
-            if is_markdown:
-                # Remove leading # from each line for markdown
-                lines = cell_content.split('\n')
-                md_lines = []
-                for line in lines:
-                    if line.startswith('# '):
-                        md_lines.append(line[2:])
-                    elif line.startswith('#'):
-                        md_lines.append(line[1:])
-                    else:
-                        md_lines.append(line)
-                cell_content = '\n'.join(md_lines)
-
-                cells.append({
-                    "cell_type": "markdown",
-                    "metadata": {},
-                    "source": cell_content.splitlines(keepends=True)
-                })
+
+
+def convert_py_to_ipynb(py_path: str, ipynb_path: str):
+    """Convert a Python file with cell markers to ipynb format."""
+
+    cells = []
+    cell_type = 'code'  # Header before the first marker is a code cell
+    source = []
+
+    # Single streaming pass: split on "# %%" / "# %% [markdown]" marker lines
+    with open(py_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            # Most lines don't start with '#': one check skips all prefix tests
+            if line[:1] != '#':
+                source.append(line)
+            elif line.startswith(CELL_MARKER):
+                _flush_cell(cells, cell_type, source)
+                # Only the tag after the marker needs checking, not the full prefix again
+                is_markdown = line.startswith(MARKDOWN_TAG, len(CELL_MARKER))
+                cell_type = 'markdown' if is_markdown else 'code'
+                source = []
+            elif cell_type == 'markdown':
+                # Remove leading '# ' or '#' from each line for markdown
+                source.append(line[2:] if line[1:2] == ' ' else line[1:])
             else:
-                if cell_content:
-                    cells.append({
-                        "cell_type": "code",
-                        "execution_count": None,
-                        "metadata": {},
-                        "outputs": [],
-                        "source": cell_content.splitlines(keepends=True)
-                    })
+                source.append(line)
+
+    _flush_cell(cells, cell_type, source)
 
     # Create notebook structure with Fabric Python (Jupyter) notebook metadata
     # Key: kernel_info.name = "jupyter" and microsoft.language_group = "jupyter_python"
@@ -110,8 +107,15 @@ def convert_py_to_ipynb(py_path: str, ipynb_path: str):
         "nbformat_minor": 5
     }
 
-    with open(ipynb_path, 'w', encoding='utf-8') as f:
-        json.dump(notebook, f, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        # orjson emits UTF-8 bytes directly (no ensure_ascii escaping)
+        with open(ipynb_path, 'wb') as f:
+            f.write(orjson.dumps(notebook, option=orjson.OPT_INDENT_2))
+    else:
+        # Encode to one string and write once (json.dump issues a write per chunk)
+        data = json.dumps(notebook, indent=2, ensure_ascii=False)
+        with open(ipynb_path, 'w', encoding='utf-8') as f:
+            f.write(data)
 
     print(f"Converted {py_path} to {ipynb_path}")
     print(f"Created {len(cells)} cells")
@@ -0,0 +1,48 @@
+-- ============================================================================
+-- Migration: Execution-log procedures without extra result rowsets
+-- ============================================================================
+-- sp_create_execution_log returns the new id via INSERT ... OUTPUT.
+-- sp_insert_result no longer selects SCOPE_IDENTITY(): the notebook calls it
+-- with a fast_executemany parameter array, which must not produce a rowset
+-- per row. Run BEFORE deploying the current dq_checker_scan notebook.
+-- Safe to re-run (CREATE OR ALTER, no table changes).
+-- ============================================================================
+
+PRINT 'Updating execution-log stored procedures...';
+GO
+
+CREATE OR ALTER PROCEDURE dbo.sp_create_execution_log
+    @run_id NVARCHAR(50),
+    @suite_id INT = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+    INSERT INTO dbo.dq_execution_logs (run_id, suite_id, execution_status, created_at)
+    OUTPUT inserted.execution_log_id
+    VALUES (@run_id, @suite_id, 'running', GETDATE());
+END;
+GO
+
+PRINT 'Updated: sp_create_execution_log';
+GO
+
+CREATE OR ALTER PROCEDURE dbo.sp_insert_result
+    @run_id NVARCHAR(50),
+    @execution_log_id BIGINT,
+    @check_id INT = NULL,
+    @check_name NVARCHAR(500),
+    @check_outcome NVARCHAR(20),
+    @check_value DECIMAL(18,4) = NULL
+AS
+BEGIN
+    SET NOCOUNT ON;
+    INSERT INTO dbo.dq_results (run_id, execution_log_id, check_id, check_name, check_outcome, check_value, created_at)
+    VALUES (@run_id, @execution_log_id, @check_id, @check_name, @check_outcome, @check_value, GETDATE());
+END;
+GO
+
+PRINT 'Updated: sp_insert_result';
+GO
+
+PRINT 'Execution-log procedures migration complete!';
+GO
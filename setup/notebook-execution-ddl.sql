@@ -72,8 +72,8 @@ AS
 BEGIN
     SET NOCOUNT ON;
     INSERT INTO dbo.dq_execution_logs (run_id, suite_id, execution_status, created_at)
+    OUTPUT inserted.execution_log_id
     VALUES (@run_id, @suite_id, 'running', GETDATE());
-    SELECT SCOPE_IDENTITY() AS execution_log_id;
 END;
 GO
 
@@ -123,7 +123,6 @@ BEGIN
     SET NOCOUNT ON;
     INSERT INTO dbo.dq_results (run_id, execution_log_id, check_id, check_name, check_outcome, check_value, created_at)
     VALUES (@run_id, @execution_log_id, @check_id, @check_name, @check_outcome, @check_value, GETDATE());
-    SELECT SCOPE_IDENTITY() AS result_id;
 END;
 GO
 
@@ -0,0 +1,72 @@
+"""Tests for SodaYAMLGenerator in the dq_checker_scan notebook.
+
+The generator cell only needs the standard library, so it is executed on its
+own without a Fabric runtime.
+"""
+import io
+import json
+import re
+import textwrap
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import pytest
+
+yaml = pytest.importorskip("yaml")
+
+NOTEBOOK = Path(__file__).resolve().parents[1] / "src" / "Notebook" / "dq_checker_scan.ipynb"
+
+
+@pytest.fixture(scope="module")
+def generator_cls():
+    cells = json.loads(NOTEBOOK.read_text(encoding="utf-8"))["cells"]
+    source = next(
+        "".join(c["source"]) for c in cells
+        if c["cell_type"] == "code" and "class SodaYAMLGenerator" in "".join(c["source"])
+    )
+    namespace = {
+        "io": io, "re": re, "textwrap": textwrap,
+        "Any": Any, "Dict": Dict, "Iterator": Iterator,
+        "List": List, "Optional": Optional, "Tuple": Tuple,
+    }
+    exec(compile(source, str(NOTEBOOK), "exec"), namespace)
+    return namespace["SodaYAMLGenerator"]
+
+
+def _custom_sql_check(sql: str) -> Dict[str, Any]:
+    return {
+        "check_id": 7, "check_name": "Orphan rows", "metric": "custom_sql",
+        "schema_name": "dbo", "table_name": "orders",
+        "custom_sql_query": sql, "fail_comparison": None, "fail_threshold": None,
+    }
+
+
+@pytest.mark.parametrize("blank", ["", "   ", "\t"])
+def test_custom_sql_with_blank_line_is_valid_yaml(generator_cls, blank):
+    sql = f"SELECT COUNT(*)\nFROM orders\n{blank}\nWHERE customer_id IS NULL"
+
+    doc = yaml.safe_load(generator_cls().generate([_custom_sql_check(sql)]))
+
+    check = doc["checks for dbo.orders"][0]["orphan_rows = 0"]
+    assert check["name"] == "Orphan rows [check_id:7]"
+    assert check["orphan_rows query"].splitlines()[0] == "SELECT COUNT(*)"
+    assert check["orphan_rows query"].rstrip().endswith("WHERE customer_id IS NULL")
+
+
+def test_safe_value_multiline_indents_every_line(generator_cls):
+    value = generator_cls.safe_value("first\n\t\nlast")
+
+    assert value == "|\n        first\n        \t\n        last"
+
+
+def test_reference_check_without_schema_defaults_to_dbo(generator_cls):
+    check = {
+        "check_id": 6, "check_name": "Customer exists", "metric": "reference",
+        "schema_name": None, "table_name": "orders", "column_name": "cust_id",
+        "reference_table": "customers", "reference_column": "id",
+    }
+
+    doc = yaml.safe_load(generator_cls().generate([check]))
+
+    query = doc["checks for orders"][0]["failed rows"]["fail query"]
+    assert "FROM dbo.orders" in query